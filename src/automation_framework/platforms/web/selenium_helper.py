@@ -38,7 +38,7 @@ import re
 from urllib.parse import urlparse
 
 from automation_framework.utils.exceptions import ActionFailedError, ElementNotFoundError 
-from automation_framework.utils.logger import automation_logger 
+from automation_framework.utils.logger import get_logger 
 
 class SeleniumHelper:
     """
@@ -114,7 +114,7 @@ class SeleniumHelper:
 
         if condition not in condition_map:
             msg = f"Unsupported condition: {condition}. Use one of: {list(condition_map.keys())}"
-            automation_logger.error(msg)
+            get_logger().error(msg)
             raise ValueError(msg)
 
         return condition_map[condition]
@@ -155,14 +155,14 @@ class SeleniumHelper:
             if hasattr(self.driver, 'current_url'):
                 return self.driver.current_url
             else:
-                automation_logger.warning("Stored driver does not have 'current_url' attribute.")
+                get_logger().warning("Stored driver does not have 'current_url' attribute.")
                 return default
         except Exception as e:
-            automation_logger.warning(f"Could not retrieve current URL from stored driver: {e}")
+            get_logger().warning(f"Could not retrieve current URL from stored driver: {e}")
             return default
 
     # --- Wait Methods ---
-    def wait_for_element_present(self, xpath: str, timeout: int = None) -> bool:
+    def wait_for_element_present(self, xpath: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Verify that an element exists in the DOM structure within a specified timeframe.
 
@@ -183,6 +183,9 @@ class SeleniumHelper:
                                 Defaults to the class's configured default_timeout
                                 if not specified. Use this to override standard wait times
                                 for elements that may take longer or shorter to appear.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the element is successfully located in the DOM within the timeout period.
@@ -200,18 +203,18 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until(EC.presence_of_element_located((By.XPATH, xpath)))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for element to be present: {xpath}",
                 extra={"timeout_seconds": effective_timeout}
             )
             return False
 
-    def wait_for_element_visible(self, xpath: str, timeout: int = None) -> bool:
+    def wait_for_element_visible(self, xpath: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Confirm that an element exists in the DOM and is visually rendered on the page.
 
@@ -232,6 +235,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for element visibility.
                                 Uses default_timeout if not provided. Override when
                                 dealing with slow-rendering content or animations.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the element is both present in the DOM and visibly rendered
@@ -250,18 +256,18 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until(EC.visibility_of_element_located((By.XPATH, xpath)))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for element to be visible: {xpath}",
                 extra={"timeout_seconds": effective_timeout}
             )
             return False
 
-    def wait_for_element_clickable(self, xpath: str, timeout: int = None):
+    def wait_for_element_clickable(self, xpath: str, timeout: int = None, poll_frequency: float = 0.5):
         """
         Ensure an element is ready for user interaction by verifying it's present, visible, and enabled.
 
@@ -284,6 +290,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for element clickability.
                                    Uses default_timeout if not provided. Increase for
                                    elements that require complex rendering or animation.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             selenium.webdriver.remote.webelement.WebElement: The fully-ready WebElement
@@ -304,19 +313,19 @@ class SeleniumHelper:
             >>> submit_button.click()
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             element = wait_instance.until(EC.element_to_be_clickable((By.XPATH, xpath)))
-            automation_logger.info(f"Element is clickable: {xpath}")
+            get_logger().info(f"Element is clickable: {xpath}")
             return element
         except TimeoutException:
             error_msg = f"Timed out waiting for element to be clickable: {xpath}"
-            automation_logger.error(error_msg, extra={"timeout_seconds": effective_timeout})
+            get_logger().error(error_msg, extra={"timeout_seconds": effective_timeout})
             # Optionally capture debug info here if needed
-            # automation_logger.capture_debug_info(driver=self.driver, context="wait_for_element_clickable", save_screenshot=True)
+            # get_logger().capture_debug_info(driver=self.driver, context="wait_for_element_clickable", save_screenshot=True)
             raise TimeoutException(error_msg)
 
-    def wait_for_text_present_in_element(self, xpath: str, text: str, timeout: int = None) -> bool:
+    def wait_for_text_present_in_element(self, xpath: str, text: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Verify that specific text content appears within an identified element.
 
@@ -341,6 +350,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for the text to appear.
                         Uses default_timeout if not specified. Extend for
                         content that requires significant processing time.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the specified text is successfully found within the target
@@ -359,18 +371,18 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until(EC.text_to_be_present_in_element((By.XPATH, xpath), text))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for text '{text}' in element: {xpath}",
                 extra={"timeout_seconds": effective_timeout, "expected_text": text}
             )
             return False
 
-    def wait_for_url_contains(self, substring: str, timeout: int = None) -> bool:
+    def wait_for_url_contains(self, substring: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Monitor the browser's current URL to verify it contains a specific substring.
 
@@ -392,6 +404,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for URL to contain the substring.
                                 Uses default_timeout if not provided. Extend for pages
                                 That require significant processing or multiple redirects.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the current URL successfully contains the specified substring
@@ -410,18 +425,18 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until(EC.url_contains(substring))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for URL to contain '{substring}'. Current URL: {self.driver.current_url}",
                 extra={"timeout_seconds": effective_timeout, "expected_substring": substring, "current_url": self.driver.current_url}
             )
             return False
 
-    def wait_for_element_not_present(self, xpath: str, timeout: int = None) -> bool:
+    def wait_for_element_not_present(self, xpath: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Confirm that an element has been completely removed from the DOM structure.
 
@@ -444,6 +459,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for element removal.
                                 Uses default_timeout if not specified. Extend for
                                 complex animations or delayed cleanup operations.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the specified element is confirmed to be absent from the DOM
@@ -462,18 +480,18 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until_not(EC.presence_of_element_located((By.XPATH, xpath)))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for element to disappear: {xpath}",
                 extra={"timeout_seconds": effective_timeout}
             )
             return False
 
-    def wait_for_element_not_visible(self, xpath: str, timeout: int = None) -> bool:
+    def wait_for_element_not_visible(self, xpath: str, timeout: int = None, poll_frequency: float = 0.5) -> bool:
         """
         Verify that an element is either not present in the DOM or is present but not visible.
 
@@ -496,6 +514,9 @@ class SeleniumHelper:
             timeout (int, optional): Maximum time in seconds to wait for element invisibility.
                                    Uses default_timeout if not specified. Extend for
                                    elements that use animated hiding effects.
+            poll_frequency (float, optional): Seconds to sleep between checks of the condition.
+                        Defaults to 0.5, Selenium's own default. Lower it to react faster,
+                        raise it to send fewer commands to the browser while waiting.
 
         Returns:
             bool: True when the element is either absent from the DOM or present but not visible
@@ -514,12 +535,12 @@ class SeleniumHelper:
             False
         """
         effective_timeout = timeout if timeout is not None else self.default_timeout
-        wait_instance = WebDriverWait(self.driver, effective_timeout)
+        wait_instance = WebDriverWait(self.driver, effective_timeout, poll_frequency=poll_frequency)
         try:
             wait_instance.until_not(EC.visibility_of_element_located((By.XPATH, xpath)))
             return True
         except TimeoutException:
-            automation_logger.warning(
+            get_logger().warning(
                 f"Timed out waiting for element to become not visible: {xpath}",
                 extra={"timeout_seconds": effective_timeout}
             )
@@ -596,12 +617,12 @@ class SeleniumHelper:
                 message=f"Element with data-testid '{test_id}' not found or not {condition} within {effective_wait_time} seconds."
             )
             current_url = self._get_current_url_or_default()
-            automation_logger.info(f"Located element by data-testid: {test_id}", extra={"locator": locator, "page_url": current_url})
+            get_logger().info(f"Located element by data-testid: {test_id}", extra={"locator": locator, "page_url": current_url})
             return element
         except TimeoutException as e:
             error_msg = f"Timeout finding element with data-testid '{test_id}' ({condition}) after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"find_by_data_test_id_{test_id}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"find_by_data_test_id_{test_id}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=test_id,
@@ -713,7 +734,7 @@ class SeleniumHelper:
                 message=f"Element with aria-label {match_type} '{aria_label}' (tag: {tag}, index: {index}) not found or not {condition} within {effective_wait_time} seconds."
             )
             current_url = self._get_current_url_or_default()
-            automation_logger.info(f"Located element by aria-label ({match_type}): {aria_label}", extra={
+            get_logger().info(f"Located element by aria-label ({match_type}): {aria_label}", extra={
                 "locator": locator, 
                 "page_url": current_url,
                 "match_type": match_type,
@@ -728,13 +749,13 @@ class SeleniumHelper:
                 total_matches = len(all_matching_elements)
                 if total_matches > 0 and index >= total_matches:
                     error_msg = f"Found {total_matches} elements with aria-label containing '{aria_label}', but requested index {index} (0-based). Available indices: 0 to {total_matches-1}"
-                    automation_logger.warning(error_msg)
+                    get_logger().warning(error_msg)
             except Exception:
                 pass
 
             error_msg = f"Timeout finding element with aria-label {match_type} '{aria_label}' (tag: {tag}, index: {index}) ({condition}) after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"find_by_aria_label_{aria_label}_{match_type}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"find_by_aria_label_{aria_label}_{match_type}")
 
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
@@ -838,7 +859,7 @@ class SeleniumHelper:
                 message=f"Element containing text '{text}' (tag: {tag}, index: {index}) not found or not {condition} within {effective_wait_time} seconds."
             )
             current_url = self._get_current_url_or_default()
-            automation_logger.info(f"Located element by visible text: '{text}'", extra={
+            get_logger().info(f"Located element by visible text: '{text}'", extra={
                 "locator": locator, 
                 "page_url": current_url,
                 "tag": tag,
@@ -851,13 +872,13 @@ class SeleniumHelper:
                 total_matches = len(all_matching_elements)
                 if total_matches > 0 and index >= total_matches:
                     error_msg = f"Found {total_matches} elements containing text '{text}', but requested index {index} (0-based). Available indices: 0 to {total_matches-1}"
-                    automation_logger.warning(error_msg)
+                    get_logger().warning(error_msg)
             except Exception:
                 pass 
 
             error_msg = f"Timeout finding element with text '{text}' (tag: {tag}, index: {index}) ({condition}) after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"find_by_visible_text_{text}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"find_by_visible_text_{text}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Text: {text}",
@@ -948,12 +969,12 @@ class SeleniumHelper:
             )
 
             current_url = self._get_current_url_or_default()
-            automation_logger.info(f"Located element by partial attribute '{attribute_name}': '{attribute_value_part}'", extra={"locator": locator, "page_url": current_url})
+            get_logger().info(f"Located element by partial attribute '{attribute_name}': '{attribute_value_part}'", extra={"locator": locator, "page_url": current_url})
             return element
         except TimeoutException as e:
             error_msg = f"Timeout finding element with {attribute_name} containing '{attribute_value_part}' ({condition}) after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"find_by_partial_attr_{attribute_name}_{attribute_value_part}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"find_by_partial_attr_{attribute_name}_{attribute_value_part}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Attr: {attribute_name}, Part: {attribute_value_part}",
@@ -1052,8 +1073,8 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout finding base element for relative locator: {base_element_locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context="find_relative_base_timeout")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context="find_relative_base_timeout")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=str(base_element_locator),
@@ -1073,7 +1094,7 @@ class SeleniumHelper:
 
         if direction not in direction_map:
             msg = f"Unsupported direction: {direction}. Use one of: {list(direction_map.keys())}"
-            automation_logger.error(msg)
+            get_logger().error(msg)
             raise ValueError(msg)
 
         relative_locator = direction_map[direction](target_element_locator)
@@ -1084,12 +1105,12 @@ class SeleniumHelper:
                 message=f"Target element relative to base element ({direction}) not found within {effective_wait_time} seconds."
             )
             current_url = self._get_current_url_or_default()
-            automation_logger.info(f"Located element relative to base: {direction}", extra={"base_locator": base_element_locator, "target_locator": target_element_locator, "page_url": current_url})
+            get_logger().info(f"Located element relative to base: {direction}", extra={"base_locator": base_element_locator, "target_locator": target_element_locator, "page_url": current_url})
             return element
         except TimeoutException as e:
             error_msg = f"Timeout finding element relative to base ({direction}) after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"find_relative_{direction}_timeout")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"find_relative_{direction}_timeout")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Relative ({direction}) to {base_element_locator}",
@@ -1216,12 +1237,12 @@ class SeleniumHelper:
                 text_content = f.read()
         except FileNotFoundError:
             error_msg = f"File not found for insertion: {file_path}"
-            automation_logger.error(error_msg)
+            get_logger().error(error_msg)
             raise
 
         except UnicodeDecodeError as e:
             error_msg = f"Could not decode file ({file_path}): {e}"
-            automation_logger.error(error_msg)
+            get_logger().error(error_msg)
             raise # Re-raises the UnicodeDecodeError
 
         effective_wait_time = wait_time if wait_time is not None else self.default_timeout
@@ -1236,9 +1257,9 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout finding element for text insertion ({condition}) using locator {locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
+            get_logger().error(error_msg)
 
-            automation_logger.capture_debug_info(driver=self.driver, context=f"insert_text_file_element_not_found_{locator[1]}")
+            get_logger().capture_debug_info(driver=self.driver, context=f"insert_text_file_element_not_found_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Target for file {file_path}",
@@ -1253,12 +1274,12 @@ class SeleniumHelper:
                 element.clear()
             element.send_keys(text_content)
             # Log success if needed
-            automation_logger.info(f"Inserted content from file '{file_path}' into element located by {locator}.")
+            get_logger().info(f"Inserted content from file '{file_path}' into element located by {locator}.")
         except Exception as e: # Catch potential issues with clear/send_keys
             error_msg = f"Failed to clear or send keys to element located by {locator} during text insertion from '{file_path}'. Error: {e}"
-            automation_logger.error(error_msg)
+            get_logger().error(error_msg)
 
-            automation_logger.capture_debug_info(driver=self.driver, context=f"insert_text_file_action_failed_{locator[1]}")
+            get_logger().capture_debug_info(driver=self.driver, context=f"insert_text_file_action_failed_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ActionFailedError(
                 action_type="insert_text_from_file",
@@ -1309,12 +1330,12 @@ class SeleniumHelper:
 
         if scroll_behavior not in valid_scroll_behaviors:
             msg = f"Unsupported scroll_behavior: {scroll_behavior}. Use one of: {valid_scroll_behaviors}"
-            automation_logger.error(msg)
+            get_logger().error(msg)
             raise ValueError(msg)
 
         if scroll_block not in valid_scroll_blocks:
             msg = f"Unsupported scroll_block: {scroll_block}. Use one of: {valid_scroll_blocks}"
-            automation_logger.error(msg)
+            get_logger().error(msg)
             raise ValueError(msg)
 
         effective_wait_time = wait_time if wait_time is not None else self.default_timeout
@@ -1329,8 +1350,8 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout finding element for scrolling ({condition}) using locator {locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"scroll_to_element_not_found_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"scroll_to_element_not_found_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Target for scrolling: {locator}",
@@ -1343,11 +1364,11 @@ class SeleniumHelper:
         try:
             js_options = f"{{behavior: '{scroll_behavior}', block: '{scroll_block}'}}"
             self.driver.execute_script(f"arguments[0].scrollIntoView({js_options});", element)
-            automation_logger.info(f"Scrolled to element located by {locator}. Options: {js_options}")
+            get_logger().info(f"Scrolled to element located by {locator}. Options: {js_options}")
         except Exception as e:
             error_msg = f"Failed to scroll to element located by {locator}. Error: {e}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"scroll_to_element_js_failed_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"scroll_to_element_js_failed_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ActionFailedError(
                 action_type="scroll_to_element",
@@ -1408,8 +1429,8 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout waiting for container element for link extraction using locator {container_locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"extract_links_container_not_found_{container_locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"extract_links_container_not_found_{container_locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Container for link extraction: {container_locator}",
@@ -1458,14 +1479,14 @@ class SeleniumHelper:
         try:
             extracted_links = self.driver.execute_script(script, *script_args)
             if not isinstance(extracted_links, list):
-                automation_logger.warning(f"JavaScript for link extraction returned non-list type: {type(extracted_links)}. Treating as empty list.")
+                get_logger().warning(f"JavaScript for link extraction returned non-list type: {type(extracted_links)}. Treating as empty list.")
                 return []
-            automation_logger.info(f"Successfully extracted {len(extracted_links)} links from container {container_locator} using selector '{link_selector}'.")
+            get_logger().info(f"Successfully extracted {len(extracted_links)} links from container {container_locator} using selector '{link_selector}'.")
             return extracted_links
         except Exception as e:
             error_msg = f"Failed to execute JavaScript for link extraction using locator {container_locator} and selector '{link_selector}'. Error: {e}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"extract_links_js_failed_{container_locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"extract_links_js_failed_{container_locator[1]}")
             return []
 
     # --- INTERACTION METHODS ---
@@ -1537,8 +1558,8 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout finding element to click ({condition}) using locator {locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"click_element_not_found_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"click_element_not_found_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Element to click: {locator}",
@@ -1550,11 +1571,11 @@ class SeleniumHelper:
 
         try:
             element.click()
-            automation_logger.info(f"Clicked element located by {locator}.")
+            get_logger().info(f"Clicked element located by {locator}.")
         except Exception as e:
             error_msg = f"Failed to click element located by {locator}. Error: {e}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"click_element_failed_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"click_element_failed_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ActionFailedError(
                 action_type="click_element",
@@ -1640,8 +1661,8 @@ class SeleniumHelper:
             )
         except TimeoutException as e:
             error_msg = f"Timeout finding input element for typing ({condition}) using locator {locator} after {effective_wait_time}s."
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"type_text_element_not_found_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"type_text_element_not_found_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ElementNotFoundError(
                 element=f"Input element for typing: {locator}",
@@ -1655,11 +1676,11 @@ class SeleniumHelper:
             if clear_before:
                 element.clear()
             element.send_keys(text)
-            automation_logger.info(f"Typed text into element located by {locator}.")
+            get_logger().info(f"Typed text into element located by {locator}.")
         except Exception as e:
             error_msg = f"Failed to type text into element located by {locator}. Error: {e}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context=f"type_text_failed_{locator[1]}")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context=f"type_text_failed_{locator[1]}")
             current_url = self._get_current_url_or_default()
             raise ActionFailedError(
                 action_type="type_text",
@@ -1700,14 +1721,20 @@ class SeleniumHelper:
             >>> closed_url = helper.close_current_tab()
             >>> print(closed_url)  # "https://google.com"
         """
-        current_url = self._get_current_url_or_default(default="Unknown_Closed_Tab")
+        # Querying current_url on a dead session can block for the full command timeout.
+        # Selenium itself never clears session_id, not even on quit() or a browser
+        # crash; it is only None here after quit_driver() has succeeded.
+        if getattr(self.driver, 'session_id', None) is not None:
+            current_url = self._get_current_url_or_default(default="Unknown_Closed_Tab")
+        else:
+            current_url = "Unknown_Closed_Tab"
         try:
             self.driver.close()
-            automation_logger.info(f"Closed the current browser tab/window. URL was: {current_url}")
+            get_logger().info(f"Closed the current browser tab/window. URL was: {current_url}")
         except Exception as e:
             error_msg = f"Failed to close the current browser tab/window. Error: {e}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(driver=self.driver, context="close_current_tab_failed")
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(driver=self.driver, context="close_current_tab_failed")
         return current_url
 
     def quit_driver(self) -> str:
@@ -1739,17 +1766,30 @@ class SeleniumHelper:
             >>> final_url = helper.quit_driver()
             >>> print(f"Session ended from: {final_url}")
         """
-        current_url = self._get_current_url_or_default(default="Unknown_Before_Quit")
+        # Querying current_url on a dead session can block for the full command timeout.
+        # Selenium itself never clears session_id, not even on quit() or a browser
+        # crash; it is only None here after quit_driver() has succeeded.
+        if getattr(self.driver, 'session_id', None) is not None:
+            current_url = self._get_current_url_or_default(default="Unknown_Before_Quit")
+        else:
+            current_url = "Unknown_Before_Quit"
         try:
             self.driver.quit()
-            automation_logger.info(f"Quit the WebDriver session. Last URL was: {current_url}")
+            # Mark the session as gone so later calls skip round-trips to it
+            self.driver.session_id = None
+            get_logger().info(f"Quit the WebDriver session. Last URL was: {current_url}")
         except Exception as e:
             error_msg = f"Failed to quit the WebDriver session. Error: {e}"
-            automation_logger.error(error_msg)
-            try:
-                automation_logger.capture_debug_info(driver=self.driver, context="quit_driver_failed")
-            except:
-                automation_logger.warning("Could not capture debug info during quit_driver due to driver state.")
+            get_logger().error(error_msg)
+            # A driver without a session cannot produce artifacts; skip the capture
+            # entirely. This only catches sessions this helper already quit, as
+            # Selenium keeps session_id set after a crash; the capture then fails
+            # on its own and is handled below.
+            if getattr(self.driver, 'session_id', None):
+                try:
+                    get_logger().capture_debug_info(driver=self.driver, context="quit_driver_failed")
+                except Exception:
+                    get_logger().warning("Could not capture debug info during quit_driver due to driver state.")
         return current_url
 
     def navigate_to(
@@ -1814,7 +1854,7 @@ class SeleniumHelper:
         parsed = urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             error_msg = f"Invalid URL format - must include protocol (e.g., 'https://'): {url}"
-            automation_logger.error(error_msg)
+            get_logger().error(error_msg)
             raise ValueError(error_msg)
 
         effective_timeout = timeout if timeout is not None else self.default_timeout
@@ -1836,7 +1876,7 @@ class SeleniumHelper:
 
                     temp_wait.until(EC.url_to_be(url))
 
-                automation_logger.info(
+                get_logger().info(
                     f"Opened URL in new tab: {url}",
                     extra={"original_url": current_url_before}
                 )
@@ -1848,15 +1888,15 @@ class SeleniumHelper:
                     temp_wait = WebDriverWait(self.driver, effective_timeout)
                     temp_wait.until(EC.url_to_be(url))
 
-                automation_logger.info(
+                get_logger().info(
                     f"Navigated to URL in current tab: {url}",
                     extra={"previous_url": current_url_before}
                 )
         
         except Exception as e:
             error_msg = f"Failed to visit website '{url}' (new_tab={in_new_tab}): {str(e)}"
-            automation_logger.error(error_msg)
-            automation_logger.capture_debug_info(
+            get_logger().error(error_msg)
+            get_logger().capture_debug_info(
                 driver=self.driver,
                 context=f"visit_website_{'new_tab' if in_new_tab else 'current_tab'}"
             )
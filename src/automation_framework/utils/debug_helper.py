@@ -30,15 +30,64 @@ Example:
 
 import os
 import json
+import functools
 import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 import platform
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import psutil
 
+try:
+    import zstandard as zstd
+except ImportError:  # Optional: page sources are stored uncompressed without it
+    zstd = None
+
 from automation_framework.utils.screenshot_manager import ScreenshotManager
 
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Dict[str, str]:
+    """
+    Return platform details, resolving them on the first capture.
+
+    The details are fixed for the lifetime of the process, and some of these
+    calls read files or spawn helpers (platform.processor() runs uname), so
+    they are looked up once, and only when something is actually captured.
+    """
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "machine": platform.machine(),
+        "python_version": platform.python_version()
+    }
+
+
+# Shared workers for running independent artifact captures side by side
+_CAPTURE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="debug_capture")
+
+
+def _mark_unsupported(caps: Dict[str, bool], name: str, error: Exception):
+    """
+    Record that a driver does not support an artifact channel.
+
+    Only errors saying the call itself is unsupported count; transient
+    failures are retried on the next capture, and a channel that has worked
+    before is never disabled.
+    """
+    if caps.get(name):
+        return
+    if (
+        isinstance(error, AttributeError)
+        or type(error).__name__ == "UnknownMethodException"
+        or "unknown command" in str(error).lower()
+    ):
+        caps[name] = False
+
+
 class DebugHelper:
     """
     Helper class for capturing comprehensive debug information during failures.
@@ -71,6 +120,27 @@ class DebugHelper:
         self.base_directory = Path(base_directory)
         self.base_directory.mkdir(parents=True, exist_ok=True)
         self.screenshot_manager = ScreenshotManager()
+        # Artifact capabilities per driver. A capability set to False means the
+        # driver rejected the call as unsupported on a previous capture and the
+        # round-trip is skipped from then on. Keyed weakly on the driver itself, so entries
+        # go away with their driver and are never inherited by a new one.
+        self._driver_caps = weakref.WeakKeyDictionary()
+        # Page source compressor, reused across captures. Compressor instances are
+        # not thread-safe and captures run on a pool, hence the lock.
+        self._zstd = zstd.ZstdCompressor(level=3, threads=-1) if zstd is not None else None
+        self._zstd_lock = threading.Lock()
+
+    def _caps_for(self, driver: object) -> Dict[str, bool]:
+        """
+        Return the capability record of a driver, creating it on first use.
+
+        Drivers that cannot be weakly referenced get a fresh record each time,
+        so nothing is remembered for them rather than risking a stale entry.
+        """
+        try:
+            return self._driver_caps.setdefault(driver, {})
+        except TypeError:
+            return {}
 
     def capture_all(
         self,
@@ -128,39 +198,54 @@ class DebugHelper:
                 'system_info': 'logs/debug_artifacts/payment_processing_system_info_20231201_143022.json'
             }
         """
-        from automation_framework.utils.logger import automation_logger
+        from automation_framework.utils.logger import get_logger
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        artifacts = {}
+        pending = {}
+
+        # The captures below are independent and mostly wait on I/O (browser
+        # round-trips, screenshot tools, the CPU sampling interval), so they run
+        # concurrently and the total cost is the slowest one rather than the sum.
 
         # Capture visual state representation
         if save_screenshot:
-            screenshot_path = self.screenshot_manager.capture_on_failure(
+            pending['screenshot'] = _CAPTURE_POOL.submit(
+                self.screenshot_manager.capture_on_failure,
                 context=context,
                 error_type="failure"
             )
-            artifacts['screenshot'] = screenshot_path
 
         # Capture web page content for web automation debugging
         if save_page_source and driver is not None:
-            page_source_path = self._capture_page_source(driver, context, timestamp)
-            artifacts['page_source'] = page_source_path
+            pending['page_source'] = _CAPTURE_POOL.submit(
+                self._capture_page_source, driver, context, timestamp
+            )
 
         # Capture browser console output for JavaScript error analysis
         if save_console_logs and driver is not None:
-            console_log_path = self._capture_console_logs(driver, context, timestamp)
-            artifacts['console_logs'] = console_log_path
+            pending['console_logs'] = _CAPTURE_POOL.submit(
+                self._capture_console_logs, driver, context, timestamp
+            )
 
         # Capture system state for resource-related issue diagnosis
         if save_system_info:
-            system_info_path = self._capture_system_info(context, timestamp)
-            artifacts['system_info'] = system_info_path
+            pending['system_info'] = _CAPTURE_POOL.submit(
+                self._capture_system_info, context, timestamp
+            )
+
+        artifacts = {}
+        for artifact_type, future in pending.items():
+            try:
+                artifacts[artifact_type] = future.result()
+            except Exception as e:
+                get_logger().warning(f"Could not capture {artifact_type}: {e}")
+                artifacts[artifact_type] = ""
 
         # Capture error details for root cause analysis
         error_info_path = self._save_error_info(context, error, timestamp)
         artifacts['error_info'] = error_info_path
 
-        automation_logger.error(f"Debug artifacts captured: {artifacts}")
+        get_logger().error(f"Debug artifacts captured: {artifacts}")
         return artifacts
 
     def capture_pyautogui_debug(
@@ -225,7 +310,7 @@ class DebugHelper:
             "error": error,
             "context": context,
             "timestamp": timestamp,
-            "platform": platform.platform(),
+            "platform": _platform_info()["platform"],
             "screen_size": self._get_screen_size()
         }
 
@@ -257,21 +342,49 @@ class DebugHelper:
             timestamp: Timestamp for creating unique filename.
 
         Returns:
-            Path to the saved HTML page source file, empty string if capture fails.
+            Path to the saved HTML page source file (zstd-compressed with a
+            ``.html.zst`` extension when ``zstandard`` is installed), empty
+            string if capture fails.
         """
-        from automation_framework.utils.logger import automation_logger
+        from automation_framework.utils.logger import get_logger
+
+        caps = self._caps_for(driver)
+        if not caps.get('page_source', True):
+            return ""
 
         try:
             page_source = driver.page_source
+            caps['page_source'] = True
+            if not page_source:
+                return ""
+            data = page_source.encode('utf-8')
             filename = f"{context}_page_source_{timestamp}.html"
+            if self._zstd is not None:
+                # HTML compresses very well; fewer bytes to write and to keep around
+                with self._zstd_lock:
+                    data = self._zstd.compress(data)
+                filename += ".zst"
             filepath = self.base_directory / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(page_source)
-            
+
+            # Single raw write of the encoded document, bypassing the text and
+            # buffered I/O layers that add nothing for a one-shot write
+            fd = os.open(
+                str(filepath),
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+                0o644
+            )
+            try:
+                view = memoryview(data)
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+            finally:
+                os.close(fd)
+
             return str(filepath)
         except Exception as e:
-            automation_logger.warning(f"Could not capture page source: {e}")
+            _mark_unsupported(caps, 'page_source', e)
+            get_logger().warning(f"Could not capture page source: {e}")
             return ""
 
     def _capture_console_logs(
@@ -297,10 +410,15 @@ class DebugHelper:
         Returns:
             Path to the saved console logs file, empty string if capture fails.
         """
-        from automation_framework.utils.logger import automation_logger
+        from automation_framework.utils.logger import get_logger
+
+        caps = self._caps_for(driver)
+        if not caps.get('console', True):
+            return ""
 
         try:
             logs = driver.get_log("browser")
+            caps['console'] = True
             if logs:
                 filename = f"{context}_console_logs_{timestamp}.log"
                 filepath = self.base_directory / filename
@@ -311,7 +429,8 @@ class DebugHelper:
                 
                 return str(filepath)
         except Exception as e:
-            automation_logger.warning(f"Could not capture console logs: {e}")
+            _mark_unsupported(caps, 'console', e)
+            get_logger().warning(f"Could not capture console logs: {e}")
         
         return ""
 
@@ -331,14 +450,11 @@ class DebugHelper:
         Returns:
             Path to the saved system information JSON file, empty string if capture fails.
         """
-        from automation_framework.utils.logger import automation_logger
+        from automation_framework.utils.logger import get_logger
 
         try:
             system_info = {
-                "platform": platform.platform(),
-                "processor": platform.processor(),
-                "machine": platform.machine(),
-                "python_version": platform.python_version(),
+                **_platform_info(),
                 "memory_total_gb": round(psutil.virtual_memory().total / (1024**3), 2),
                 "memory_available_gb": round(psutil.virtual_memory().available / (1024**3), 2),
                 "cpu_percent": psutil.cpu_percent(interval=1),
@@ -355,7 +471,7 @@ class DebugHelper:
             
             return str(filepath)
         except Exception as e:
-            automation_logger.warning(f"Could not capture system info: {e}")
+            get_logger().warning(f"Could not capture system info: {e}")
             return ""
 
     def _save_error_info(self, context: str, error: str, timestamp: str) -> str:
@@ -17,7 +17,120 @@ Each exception stores relevant debugging information like component names,
 actions performed, and contextual details to help identify the root cause quickly.
 """
 
-from typing import Optional, Dict, Any
+import types
+import uuid
+import datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Optional, Dict, Any, Mapping
+
+# Shared read-only details for errors that have none, so no dict is allocated
+_EMPTY_DETAILS = types.MappingProxyType({})
+
+# Longest str/bytes value kept in caller-provided details
+_MAX_DETAIL_SIZE = 2048
+# Container levels kept in caller-provided details below the top-level mapping
+_MAX_DETAIL_DEPTH = 2
+# Message passed by subclasses that build their base message on demand
+_DEFERRED = object()
+# Value types whose repr is cheap and informative, kept as text in details
+_REPR_LEAF_TYPES = (
+    PurePath, Enum, Decimal, uuid.UUID, complex,
+    datetime.date, datetime.time, datetime.timedelta
+)
+
+
+def _bound_details(value: Any, depth: int = 0) -> Any:
+    """
+    Copy caller-provided details with oversized and opaque values replaced.
+
+    Strings and bytes longer than _MAX_DETAIL_SIZE are cut and annotated with
+    the number of dropped bytes. Simple values such as paths, enums and
+    dates are kept as their repr, and any other object that is not a scalar
+    or a shallow container (drivers, WebElements, screenshots, ...) is
+    replaced by a '<TypeName>' placeholder. This keeps an exception from holding on to, and
+    later serializing, megabytes of context such as a full page source.
+
+    Args:
+        value: Details mapping, or a value nested inside it
+        depth: Current container nesting level
+
+    Returns:
+        Bounded copy of the value
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        if len(value) > _MAX_DETAIL_SIZE:
+            return f"{value[:_MAX_DETAIL_SIZE]}...<+{len(value) - _MAX_DETAIL_SIZE}B>"
+        return value
+    if isinstance(value, bytes):
+        if len(value) > _MAX_DETAIL_SIZE:
+            return value[:_MAX_DETAIL_SIZE] + b"...<+%dB>" % (len(value) - _MAX_DETAIL_SIZE)
+        return value
+    if depth <= _MAX_DETAIL_DEPTH:
+        if isinstance(value, dict):
+            return {key: _bound_details(item, depth + 1) for key, item in value.items()}
+        if isinstance(value, list):
+            return [_bound_details(item, depth + 1) for item in value]
+        if isinstance(value, tuple):
+            items = [_bound_details(item, depth + 1) for item in value]
+            if hasattr(value, "_fields"):
+                # Named tuples take their fields positionally
+                return type(value)(*items)
+            return tuple(items)
+    if isinstance(value, _REPR_LEAF_TYPES):
+        text = repr(value)
+        if len(text) > _MAX_DETAIL_SIZE:
+            return f"{text[:_MAX_DETAIL_SIZE]}...<+{len(text) - _MAX_DETAIL_SIZE}B>"
+        return text
+    return f"<{type(value).__name__}>"
+
+
+def _serialize_details(value: Any, max_depth: int = 3, max_len: int = 512) -> str:
+    """
+    Render error details as a bounded, repr-like string.
+
+    Unlike a plain repr(), this never descends more than max_depth levels into
+    nested containers and truncates long strings and leaf reprs to max_len
+    characters, so large payloads (page sources, DOM snapshots) cannot blow up
+    an error message. WebElements are summarized by class and element id.
+
+    Args:
+        value: Details mapping (or any nested value) to render
+        max_depth: Number of container levels to expand before eliding with '<...>'
+        max_len: Maximum number of characters kept from any single leaf
+
+    Returns:
+        Readable string representation of the value within the given bounds
+    """
+    if isinstance(value, str):
+        if len(value) > max_len:
+            return repr(value[:max_len]) + "..."
+        return repr(value)
+    if isinstance(value, (dict, types.MappingProxyType, list, tuple, set, frozenset)):
+        if max_depth <= 0:
+            return "<...>"
+        if isinstance(value, (dict, types.MappingProxyType)):
+            items = ", ".join(
+                f"{_serialize_details(k, max_depth - 1, max_len)}: {_serialize_details(v, max_depth - 1, max_len)}"
+                for k, v in value.items()
+            )
+            return "{" + items + "}"
+        items = ", ".join(_serialize_details(v, max_depth - 1, max_len) for v in value)
+        if isinstance(value, list):
+            return "[" + items + "]"
+        if isinstance(value, tuple):
+            return "(" + items + ("," if len(value) == 1 else "") + ")"
+        return "{" + items + "}"
+    if hasattr(type(value), "tag_name"):
+        # Selenium WebElement: identify it without touching the browser
+        return f"<{type(value).__name__} {getattr(value, 'id', '?')}>"
+    text = repr(value)
+    if len(text) > max_len:
+        return text[:max_len] + "..."
+    return text
 
 
 class AutomationError(Exception):
@@ -61,6 +174,9 @@ class AutomationError(Exception):
         ...     )
     """
 
+    # Attributes reported as details when the caller does not provide any
+    _detail_fields = ()
+
     def __init__(
         self,
         message: str,
@@ -72,21 +188,81 @@ class AutomationError(Exception):
         """Initialize the automation error with comprehensive context."""
         self.component = component
         self.action = action
-        self.details = details or {}
+        # Provided details are bounded up front; default details are only
+        # synthesized when first read, see the details property
+        self._details = _bound_details(details) if details else None
         self.original_exception = original_exception
-        
-        # Format complete error message with all available context
-        formatted_message = self._format_message(message)
-        super().__init__(formatted_message)
+        # Chain the original (PEP 3134) so tracebacks and logging's exc_info
+        # render it lazily instead of it being stringified into the message.
+        # Setting __cause__ also suppresses the implicit context, so only do
+        # it when there is something to chain.
+        if original_exception is not None:
+            self.__cause__ = original_exception
+        self._base_message = message
+        self._formatted = None
+
+        # The complete message is only assembled when the error is stringified,
+        # so errors that are caught and discarded never pay for it. Subclasses
+        # pass message=_DEFERRED and build their base message on demand instead;
+        # they set args to their own constructor arguments so that repr(),
+        # pickling and copying rebuild the same error.
+        if message is not _DEFERRED:
+            super().__init__(message)
+
+    @property
+    def details(self) -> Mapping[str, Any]:
+        """Mapping of debugging context, built from the error's fields on first access."""
+        if self._details is None:
+            self._details = self._default_details()
+        return self._details
+
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]):
+        self._details = _bound_details(value) if value else None
+
+    def _default_details(self) -> Mapping[str, Any]:
+        """
+        Build the details used when the caller did not provide any.
+
+        The details are read from the attributes named in the class's
+        _detail_fields table, so subclasses only declare which of their
+        fields to report.
+
+        Returns:
+            Mapping of context derived from the error's own fields; the shared
+            empty mapping when there is nothing to add
+        """
+        if not self._detail_fields:
+            return _EMPTY_DETAILS
+        return {name: getattr(self, name) for name in self._detail_fields}
+
+    def __str__(self) -> str:
+        """Return the complete error message, formatting it on first use."""
+        if self._formatted is None:
+            self._formatted = self._format_message(self._build_base_message())
+        return self._formatted
+
+    def _build_base_message(self) -> str:
+        """
+        Return the base error message before context information is added.
+
+        Subclasses that derive their message from their own fields override
+        this so the message is only built when it is actually needed.
+
+        Returns:
+            Base error message describing the failure condition
+        """
+        return str(self._base_message)
 
     def _format_message(self, message: str) -> str:
         """
         Construct a comprehensive error message combining all context information.
 
         This method intelligently combines the base message with component,
-        action, details, and original exception information to create a
-        single, informative error string that provides maximum debugging value
-        at first glance.
+        action, and details information to create a single, informative
+        error string that provides maximum debugging value at first glance.
+        The pieces are collected and joined once rather than concatenated
+        step by step.
 
         Args:
             message: Base error message describing the failure condition
@@ -94,14 +270,13 @@ class AutomationError(Exception):
         Returns:
             Complete error message string containing all relevant context
         """
-        formatted = f"[{self.component}] {message}"
+        parts = ["[", str(self.component), "] ", message]
         if self.action != "Unknown":
-            formatted += f" during '{self.action}'"
-        if self.details:
-            formatted += f" (details: {self.details})"
-        if self.original_exception:
-            formatted += f" (original: {type(self.original_exception).__name__}: {self.original_exception})"
-        return formatted
+            parts += [" during '", str(self.action), "'"]
+        details = self.details
+        if details:
+            parts += [" (details: ", _serialize_details(details), ")"]
+        return "".join(parts)
 
 class ActionFailedError(AutomationError):
     """Raised when a UI interaction action fails despite the element being present.
@@ -141,6 +316,8 @@ class ActionFailedError(AutomationError):
         ... )
     """
 
+    _detail_fields = ("action_type", "element", "reason")
+
     def __init__(
         self,
         action_type: str,
@@ -154,19 +331,18 @@ class ActionFailedError(AutomationError):
         self.element = element
         self.page = page
         self.reason = reason
-        
-        message = f"Action '{action_type}' failed on element '{element}': {reason}"
-        
+
         super().__init__(
-            message=message,
+            message=_DEFERRED,
             component=page,
             action=f"{action_type}_{element}",
-            details=details or {
-                "action_type": action_type,
-                "element": element,
-                "reason": reason
-            }
+            details=details
         )
+        self.args = (action_type, element, page, reason, self._details)
+
+    def _build_base_message(self) -> str:
+        """Describe the failed interaction from the stored action context."""
+        return f"Action '{self.action_type}' failed on element '{self.element}': {self.reason}"
 
 class ElementNotFoundError(AutomationError):
     """
@@ -207,6 +383,8 @@ class ElementNotFoundError(AutomationError):
         ... )
     """
 
+    _detail_fields = ("element", "locator", "timeout")
+
     def __init__(
         self,
         element: str,
@@ -220,19 +398,23 @@ class ElementNotFoundError(AutomationError):
         self.page = page
         self.locator = locator
         self.timeout = timeout
-        
-        message = f"Element '{element}' not found"
-        if locator != "Unknown":
-            message += f" using locator {locator}"
-        if timeout is not None:
-            message += f" after {timeout}s"
-            
+
         super().__init__(
-            message=message,
+            message=_DEFERRED,
             component=page,
             action=f"find_{element}",
-            details=details or {"element": element, "locator": locator, "timeout": timeout}
+            details=details
         )
+        self.args = (element, page, locator, timeout, self._details)
+
+    def _build_base_message(self) -> str:
+        """Describe the missing element from the stored search context."""
+        message = f"Element '{self.element}' not found"
+        if self.locator != "Unknown":
+            message += f" using locator {self.locator}"
+        if self.timeout is not None:
+            message += f" after {self.timeout}s"
+        return message
 
 class NavigationError(AutomationError):
     """Raised when page navigation fails or unexpected page states are encountered.
@@ -272,6 +454,8 @@ class NavigationError(AutomationError):
         ... )
     """
 
+    _detail_fields = ("url", "expected_title", "actual_title", "timeout")
+
     def __init__(
         self,
         url: str,
@@ -285,28 +469,27 @@ class NavigationError(AutomationError):
         self.expected_title = expected_title
         self.actual_title = actual_title
         self.timeout = timeout
-        
-        message = f"Navigation to '{url}' failed"
-        if expected_title and actual_title:
-            message += f". Expected: '{expected_title}', Got: '{actual_title}'"
-        elif expected_title:
-            message += f". Expected title: '{expected_title}'"
-        elif actual_title:
-            message += f". Actual title: '{actual_title}'"
-        if timeout:
-            message += f" after {timeout}s"
-            
+
         super().__init__(
-            message=message,
+            message=_DEFERRED,
             component="Navigation",
             action="navigate",
-            details=details or {
-                "url": url,
-                "expected_title": expected_title,
-                "actual_title": actual_title,
-                "timeout": timeout
-            }
+            details=details
         )
+        self.args = (url, expected_title, actual_title, timeout, self._details)
+
+    def _build_base_message(self) -> str:
+        """Describe the failed navigation from the stored URL and page state."""
+        message = f"Navigation to '{self.url}' failed"
+        if self.expected_title and self.actual_title:
+            message += f". Expected: '{self.expected_title}', Got: '{self.actual_title}'"
+        elif self.expected_title:
+            message += f". Expected title: '{self.expected_title}'"
+        elif self.actual_title:
+            message += f". Actual title: '{self.actual_title}'"
+        if self.timeout:
+            message += f" after {self.timeout}s"
+        return message
 
 class PyAutoGUIError(AutomationError):
     """Raised when PyAutoGUI desktop automation operations encounter failures.
@@ -344,6 +527,8 @@ class PyAutoGUIError(AutomationError):
         ... )
     """
 
+    _detail_fields = ("operation", "target", "reason")
+
     def __init__(
         self,
         operation: str,
@@ -355,16 +540,15 @@ class PyAutoGUIError(AutomationError):
         self.operation = operation
         self.target = target
         self.reason = reason
-        
-        message = f"PyAutoGUI operation '{operation}' failed on '{target}': {reason}"
-        
+
         super().__init__(
-            message=message,
+            message=_DEFERRED,
             component="PyAutoGUI",
             action=f"{operation}_{target}",
-            details=details or {
-                "operation": operation,
-                "target": target,
-                "reason": reason
-            }
-        )
\ No newline at end of file
+            details=details
+        )
+        self.args = (operation, target, reason, self._details)
+
+    def _build_base_message(self) -> str:
+        """Describe the failed desktop operation from the stored context."""
+        return f"PyAutoGUI operation '{self.operation}' failed on '{self.target}': {self.reason}"
@@ -19,14 +19,202 @@ Example:
     >>> automation_logger.capture_debug_info(driver, context="login_test")
 """
 
+import io
 import os
+import time
+import atexit
+import queue
+import socket
 import logging
+import logging.handlers
+import multiprocessing.util
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
-from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Optional, TYPE_CHECKING
 
 from automation_framework.utils.debug_helper import DebugHelper
+from automation_framework.utils.exceptions import _serialize_details
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing selenium at runtime is expensive
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+# Log location, resolved once; override with the AF_LOG_DIR environment variable.
+# The directory is created when the handlers are set up, not on import.
+_LOG_DIR = Path(os.environ.get("AF_LOG_DIR", "logs")).resolve()
+_LOG_FILE = _LOG_DIR / "automation.log"
+
+# Formatter for the detailed file log, built once and shared
+_FILE_FMT = logging.Formatter(
+    "%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(funcName)s() - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Short format for syslog; the daemon adds its own timestamp and host
+_SYSLOG_FMT = logging.Formatter("%(name)s: %(levelname)s %(message)s")
+_SYSLOG_ADDRESS = "/dev/log"
+
+
+def _syslog_available() -> bool:
+    """
+    Check that a local syslog daemon accepts datagrams on _SYSLOG_ADDRESS.
+
+    SysLogHandler swallows connection errors on newer Pythons and then fails
+    on every record, so the socket is probed before choosing it.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return False
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        probe.connect(_SYSLOG_ADDRESS)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+_helper: Optional[DebugHelper] = None
+_helper_lock = threading.Lock()
+
+
+def _debug_helper() -> DebugHelper:
+    """
+    Return the process-wide DebugHelper, creating it on first use.
+
+    DebugHelper creates its artifact directories when constructed, so it is
+    only built once something actually captures debug information.
+    """
+    global _helper
+    if _helper is None:
+        with _helper_lock:
+            if _helper is None:
+                _helper = DebugHelper()
+    return _helper
+
+
+class _CachedRepr:
+    """
+    Log argument that renders a context mapping on demand.
+
+    logging only converts arguments to text when a record is emitted, so the
+    bounded representation is built for emitted records only, and at most
+    once per record however many handlers format it.
+    """
+
+    __slots__ = ("_value", "_text")
+
+    def __init__(self, value: dict):
+        self._value = value
+        self._text = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = _serialize_details(self._value)
+        return self._text
+
+    __repr__ = __str__
+
+
+def _merge_context(extra: Optional[dict], kwargs: dict) -> Optional[dict]:
+    """Combine the extra mapping and keyword context of a log call."""
+    if not kwargs:
+        return extra
+    if not extra:
+        return kwargs
+    return {**extra, **kwargs}
+
+
+class _FastStreamHandler(logging.StreamHandler):
+    """
+    Console handler that writes a fixed "timestamp [LEVEL] message" line,
+    followed by the traceback when the record carries one.
+
+    The console output never needs more than this, so the record is written
+    directly rather than going through a Formatter and its generic attribute
+    substitution for every line.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        """Write the record to the stream in the console line format."""
+        try:
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(record.created))
+            line = f"{timestamp} [{record.levelname}] {record.getMessage()}"
+            if record.exc_info and not record.exc_text:
+                # Cached on the record, so the file formatter reuses it
+                record.exc_text = _FILE_FMT.formatException(record.exc_info)
+            if record.exc_text:
+                line = f"{line}\n{record.exc_text}"
+            self.stream.write(line + self.terminator)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues records as they are.
+
+    The stock handler formats each record on the calling thread so it can be
+    pickled for another process. The queue here only ever feeds a listener
+    thread in the same process, so the message, context and any traceback
+    are left for the listener's handlers to format.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged."""
+        return record
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that batches writes through a large buffer.
+
+    The stock handler flushes after every record, costing one write syscall
+    per log line. This handler keeps records in a 1 MiB buffer and only
+    flushes when the buffer fills, when a WARNING or higher record arrives,
+    or when the handler is closed. The file size used for rotation is tracked
+    in memory so that checking it never forces a flush.
+    """
+
+    buffer_size = 1 << 20
+
+    def _open(self):
+        """Open the log file in binary append mode behind a large text buffer."""
+        raw = open(self.baseFilename, "ab", buffering=self.buffer_size)
+        self._size = raw.tell()
+        return io.TextIOWrapper(
+            raw,
+            encoding=self.encoding,
+            errors=getattr(self, "errors", None),
+            write_through=False,
+            line_buffering=False
+        )
+
+    def emit(self, record: logging.LogRecord):
+        """Write the record to the buffer, rotating and flushing as needed."""
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            # maxBytes is in bytes; only non-ASCII text needs encoding to count them
+            size = len(msg) if msg.isascii() else len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._size and self._size + size > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= logging.WARNING:
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class AutomationLogger:
@@ -42,8 +230,34 @@ class AutomationLogger:
     structured logging formats, multi-channel output, and automatic debug
     artifact correlation. It handles concurrent access safely and provides
     configurable log levels for different execution environments.
+
+    The class is a singleton: every AutomationLogger() call returns the same
+    instance, so handlers and the debug helper are only set up once.
     """
 
+    __slots__ = (
+        "_initialized", "logger", "_recent", "_recent_lock", "_capture_cache",
+        "min_severity", "_capture_enabled", "_log_queue", "_listener",
+        # multiprocessing's after-fork registry holds the logger weakly
+        "__weakref__"
+    )
+
+    _instance = None
+
+    # Identical warnings/errors repeated within this many seconds are suppressed
+    _DEDUP_WINDOW = 5.0
+    # Upper bound on the number of distinct messages tracked for suppression
+    _DEDUP_MAX_KEYS = 1024
+    # Artifacts captured for the same context and page are reused for this many seconds
+    _CAPTURE_CACHE_TTL = 5.0
+
+    def __new__(cls):
+        """Return the shared logger instance, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
     def __init__(self):
         """
         Initialize the automation logger with comprehensive handler configuration.
@@ -53,10 +267,12 @@ class AutomationLogger:
         ensures that duplicate handlers are not added to prevent redundant
         log entries while maintaining all necessary output streams.
 
-        The method also initializes the debug helper component for integrated
-        artifact capture during error conditions, creating a cohesive logging
-        and debugging ecosystem.
+        The debug helper used for integrated artifact capture during error
+        conditions is shared process-wide and only created on first use, see
+        the debug_helper property.
         """
+        if self._initialized:
+            return
 
         self.logger = logging.getLogger("Automation")
         self.logger.setLevel(logging.DEBUG)
@@ -65,7 +281,20 @@ class AutomationLogger:
         if not self.logger.handlers:
             self._setup_handlers()
 
-        self.debug_helper = DebugHelper()
+        self._recent = OrderedDict()
+        self._recent_lock = threading.Lock()
+        # Registered after the queue listener, so it runs before the listener stops
+        atexit.register(self._flush_suppressed)
+        self._capture_cache = {}
+        self.min_severity = logging.ERROR
+        # Debug artifact capture can be switched off entirely, e.g. on CI
+        self._capture_enabled = os.environ.get("AF_DEBUG_CAPTURE", "1") == "1"
+        self._initialized = True
+
+    @property
+    def debug_helper(self) -> DebugHelper:
+        """Shared debug helper used for artifact capture."""
+        return _debug_helper()
 
     def _setup_handlers(self):
         """
@@ -76,31 +305,151 @@ class AutomationLogger:
         historical records. Each channel has appropriate formatting and filtering
         to optimize information delivery while maintaining comprehensive logging
         coverage for troubleshooting and analysis purposes.
+
+        With AF_LOG_SYSLOG=1 the console channel is replaced by the local
+        syslog daemon (/dev/log), which takes over writing those records;
+        the console is kept when no syslog socket is available.
         """
         # Console handler for real-time feedback during test execution
-        console_handler = logging.StreamHandler()
+        if os.environ.get("AF_LOG_SYSLOG") == "1" and _syslog_available():
+            console_handler = logging.handlers.SysLogHandler(
+                address=_SYSLOG_ADDRESS,
+                socktype=socket.SOCK_DGRAM
+            )
+            console_handler.setFormatter(_SYSLOG_FMT)
+        else:
+            console_handler = _FastStreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-        
+
         # File handler for detailed persistent logs with full context information
-        file_handler = logging.FileHandler(
-            "logs/automation.log",
+        _LOG_DIR.mkdir(parents=True, exist_ok=True)
+        file_handler = _BufferedRotatingFileHandler(
+            _LOG_FILE,
+            maxBytes=64 << 20,
+            backupCount=5,
             encoding="utf-8"
         )
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(
-            "%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(funcName)s() - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
+        file_handler.setFormatter(_FILE_FMT)
+
+        # Hand file records over in batches so the file handler's lock and
+        # formatting run once per batch rather than per record. Warnings and
+        # above are passed through immediately, matching the file handler's
+        # flush policy; the rest is drained by logging.shutdown() at exit.
+        file_batcher = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True
+        )
+        file_batcher.setLevel(logging.DEBUG)
+
+        # The logger itself only enqueues records; a background listener thread
+        # owns the real handlers, so formatting as well as console and disk I/O
+        # happen off the caller's thread.
+        # SimpleQueue is unbounded and lock-free on put, unlike queue.Queue.
+        self._log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_LocalQueueHandler(self._log_queue))
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue,
+            console_handler,
+            file_batcher,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._stop_listener)
+
+        # The listener thread does not survive fork(); without this a forked
+        # worker would keep enqueuing records that nothing ever reads
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(
+                before=self._flush_handlers,
+                after_in_child=self._restart_listener
+            )
+        # multiprocessing workers leave through os._exit(), skipping atexit and
+        # logging.shutdown(); hook into their own exit handling instead
+        multiprocessing.util.register_after_fork(self, AutomationLogger._register_worker_exit)
+
+    def _stop_listener(self):
+        """Stop the current queue listener, writing out the queued records."""
+        self._listener.stop()
+
+    def _flush_handlers(self):
+        """
+        Write out records buffered by the handlers.
+
+        Called before fork() so the child does not inherit, and later write a
+        second copy of, lines still sitting in the parent's buffers.
+        """
+        for handler in self._listener.handlers:
+            handler.flush()
+            target = getattr(handler, "target", None)
+            if target is not None:
+                target.flush()
+
+    def _restart_listener(self):
+        """
+        Give a forked child its own queue and listener thread.
+
+        Records already queued in the parent are left to the parent's listener;
+        the child starts from an empty queue.
+        """
+        self._log_queue = queue.SimpleQueue()
+        for handler in self.logger.handlers:
+            if isinstance(handler, logging.handlers.QueueHandler):
+                handler.queue = self._log_queue
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue,
+            *self._listener.handlers,
+            respect_handler_level=True
         )
-        file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        self._listener.start()
+        # Pending repeat counts belong to the parent, which reports them itself
+        self._recent_lock = threading.Lock()
+        self._recent.clear()
+
+    def _register_worker_exit(self):
+        """
+        Write out a multiprocessing worker's logs when the worker finishes.
+
+        Runs in the worker after multiprocessing has reset its exit handlers;
+        the finalizer is run by multiprocessing before the worker calls
+        os._exit(). Processes forked directly with os.fork() must exit
+        normally (sys.exit) for their atexit hooks to do the same.
+        """
+        multiprocessing.util.Finalize(None, self._shutdown_worker, exitpriority=10)
+
+    def _shutdown_worker(self):
+        """Report pending repeat counts, drain the queue and flush the handlers."""
+        self._flush_suppressed()
+        self._listener.stop()
+        self._flush_handlers()
 
-    def info(self, message: str, extra: Optional[dict] = None):
+    def debug(self, message: str, extra: Optional[dict] = None, **kwargs):
+        """
+        Record detailed diagnostic events for troubleshooting.
+
+        Debug records only reach the log file, keeping the console readable.
+        They are meant for fine-grained tracing inside loops and retries, and
+        cost almost nothing when the DEBUG level is disabled.
+
+        Args:
+            message: Description of the diagnostic event.
+            extra: Optional additional context data to include with the log.
+            **kwargs: Additional context given as keyword arguments, merged into extra.
+
+        Example:
+            >>> automation_logger.debug("Polling for element", extra={"attempt": 3})
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        context = _merge_context(extra, kwargs)
+        if context:
+            self.logger.debug("%s | Context: %s", message, _CachedRepr(context))
+        else:
+            self.logger.debug(message)
+
+    def info(self, message: str, extra: Optional[dict] = None, **kwargs):
         """
         Record informational events that track normal operational flow.
 
@@ -114,15 +463,21 @@ class AutomationLogger:
                     Should be concise yet informative about the operation.
             extra: Optional additional context data to include with the log.
                   Useful for including identifiers, parameters, or state information.
+            **kwargs: Additional context given as keyword arguments, merged into extra.
 
         Example:
             >>> automation_logger.info("User logged in successfully", extra={"user_id": 12345})
         """
-        if extra:
-            message = f"{message} | Context: {extra}"
-        self.logger.info(message)
-
-    def warning(self, message: str, extra: Optional[dict] = None):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        context = _merge_context(extra, kwargs)
+        if context:
+            # Deferred formatting: the context is only rendered if a handler emits the record
+            self.logger.info("%s | Context: %s", message, _CachedRepr(context))
+        else:
+            self.logger.info(message)
+
+    def warning(self, message: str, extra: Optional[dict] = None, **kwargs):
         """
         Log potential issues that don't halt execution but warrant attention.
 
@@ -135,15 +490,31 @@ class AutomationLogger:
             message: Description of the warning condition or potential issue.
             extra: Optional additional context data to include with the log.
                   Useful for capturing state information or environmental factors.
+            **kwargs: Additional context given as keyword arguments, merged into extra.
 
         Example:
             >>> automation_logger.warning("Slow response detected", extra={"response_time": 5.2})
         """
-        if extra:
-            message = f"{message} | Context: {extra}"
-        self.logger.warning(message)
-
-    def error(self, message: str, extra: Optional[dict] = None):
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        suffix = self._dedup(logging.WARNING, message)
+        if suffix is None:
+            return
+        if suffix:
+            message = f"{message}{suffix}"
+        context = _merge_context(extra, kwargs)
+        if context:
+            self.logger.warning("%s | Context: %s", message, _CachedRepr(context))
+        else:
+            self.logger.warning(message)
+
+    def error(
+        self,
+        message: str,
+        extra: Optional[dict] = None,
+        exc: Optional[BaseException] = None,
+        **kwargs
+    ):
         """
         Document errors that impact test execution or expected behavior.
 
@@ -155,15 +526,30 @@ class AutomationLogger:
             message: Detailed description of the error condition.
             extra: Optional additional context data to include with the log.
                   Essential for capturing relevant state information for debugging.
+            **kwargs: Additional context given as keyword arguments, merged into extra.
+            exc: Optional exception to attach to the record. Its traceback and
+                cause chain are formatted by the handlers, and only if the
+                record is actually emitted.
 
         Example:
             >>> automation_logger.error("Login failed", extra={"attempt": 1, "user": "test@example.com"})
         """
-        if extra:
-            message = f"{message} | Context: {extra}"
-        self.logger.error(message)
-
-    def critical(self, message: str, extra: Optional[dict] = None):
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        if exc is None:
+            # Each exception carries its own traceback, so those are never deduplicated
+            suffix = self._dedup(logging.ERROR, message)
+            if suffix is None:
+                return
+            if suffix:
+                message = f"{message}{suffix}"
+        context = _merge_context(extra, kwargs)
+        if context:
+            self.logger.error("%s | Context: %s", message, _CachedRepr(context), exc_info=exc)
+        else:
+            self.logger.error(message, exc_info=exc)
+
+    def critical(self, message: str, extra: Optional[dict] = None, **kwargs):
         """
         Record critical system failures that halt operations or compromise stability.
 
@@ -176,22 +562,89 @@ class AutomationLogger:
             message: Comprehensive description of the critical failure.
             extra: Optional additional context data to include with the log.
                   Critical for understanding the scope and impact of the failure.
+            **kwargs: Additional context given as keyword arguments, merged into extra.
 
         Example:
             >>> automation_logger.critical("System unavailable", extra={"service": "authentication"})
         """
-        if extra:
-            message = f"{message} | Context: {extra}"
-        self.logger.critical(message)
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        context = _merge_context(extra, kwargs)
+        if context:
+            self.logger.critical("%s | Context: %s", message, _CachedRepr(context))
+        else:
+            self.logger.critical(message)
+
+    def _dedup(self, level: int, message: str) -> Optional[str]:
+        """
+        Rate-limit identical messages logged in quick succession.
+
+        Retry loops tend to report the same failure many times in a row. The
+        first occurrence is logged; repeats within the dedup window are counted
+        and dropped, and the count is reported with the next occurrence logged
+        after the window has passed. Counts for messages that never recur are
+        reported when their entry is evicted and at interpreter exit, see
+        _flush_suppressed.
+
+        Args:
+            level: Logging level the message is recorded at.
+            message: Message text, used together with the level as the dedup key.
+
+        Returns:
+            None when the message should be suppressed. Otherwise a suffix to
+            append to the message: empty, or a note on how many repeats were
+            suppressed since it was last logged.
+        """
+        # Callers may log exceptions or other objects; key on their text
+        key = hash((level, str(message)))
+        now = time.monotonic()
+        evicted = None
+        with self._recent_lock:
+            entry = self._recent.get(key)
+            if entry is not None:
+                suppressed, since = entry[0], entry[1]
+                if now - since < self._DEDUP_WINDOW:
+                    entry[0] += 1
+                    return None
+                self._recent.move_to_end(key)
+            else:
+                suppressed, since = 0, now
+                if len(self._recent) >= self._DEDUP_MAX_KEYS:
+                    evicted = self._recent.popitem(last=False)[1]
+            self._recent[key] = [0, now, level, message]
+
+        if evicted is not None:
+            self._report_suppressed(evicted, now)
+        if suppressed:
+            return f" (repeated {suppressed} more times in {now - since:.0f}s)"
+        return ""
+
+    def _report_suppressed(self, entry: list, now: float):
+        """Log the repeat count of a dedup entry, if any repeats were dropped."""
+        suppressed, since, level, message = entry
+        if suppressed:
+            self.logger.log(
+                level, "%s (repeated %d more times in %.0fs)", message, suppressed, now - since
+            )
+
+    def _flush_suppressed(self):
+        """Report repeat counts that are still pending, e.g. at exit."""
+        now = time.monotonic()
+        with self._recent_lock:
+            entries = list(self._recent.values())
+            self._recent.clear()
+        for entry in entries:
+            self._report_suppressed(entry, now)
 
     def capture_debug_info(
         self,
-        driver: Optional[WebDriver] = None,
+        driver: Optional["WebDriver"] = None,
         context: str = "Unknown",
         save_screenshot: bool = True,
         save_page_source: bool = True,
         save_console_logs: bool = True,
-        save_system_info: bool = True
+        save_system_info: bool = True,
+        severity: int = logging.ERROR
     ) -> dict:
         """
         Orchestrate comprehensive debug artifact capture for failure analysis.
@@ -207,6 +660,10 @@ class AutomationLogger:
         combinations of artifacts based on the specific automation context
         and resource constraints.
 
+        Captures are expensive, so repeated calls for the same context, page
+        and artifact selection within a few seconds (typically retry loops)
+        return the artifacts of the first call, and captures below ``min_severity`` are skipped.
+
         Args:
             driver: Optional Selenium WebDriver instance for web automation artifacts.
                    Required for page source and console log capture.
@@ -216,10 +673,14 @@ class AutomationLogger:
             save_page_source: Whether to capture HTML source (requires driver).
             save_console_logs: Whether to capture browser console output (requires driver).
             save_system_info: Whether to capture system resource and platform details.
+            severity: Logging level of the failure being captured. Nothing is
+                    captured when it is below the logger's min_severity.
 
         Returns:
             Dictionary mapping artifact type identifiers to their file paths.
             Enables easy access to all captured debug information for analysis.
+            Empty when the capture was skipped because of its severity or
+            because capture is disabled with AF_DEBUG_CAPTURE=0.
 
         Example:
             >>> from selenium import webdriver
@@ -236,6 +697,27 @@ class AutomationLogger:
             ...     )
             ...     print(f"Debug artifacts: {artifacts}")
         """
+        if not self._capture_enabled or severity < self.min_severity:
+            return {}
+        if driver is None:
+            # Driver-backed artifacts cannot be produced without a driver
+            save_page_source = save_console_logs = False
+
+        current_url = None
+        # Only ask a live session for its URL, so a dead one does not stall here
+        if driver is not None and getattr(driver, "session_id", None) is not None:
+            try:
+                current_url = driver.current_url
+            except Exception:
+                pass
+        cache_key = (
+            context, current_url,
+            save_screenshot, save_page_source, save_console_logs, save_system_info
+        )
+        now = time.monotonic()
+        cached = self._capture_cache.get(cache_key)
+        if cached is not None and now - cached[0] < self._CAPTURE_CACHE_TTL:
+            return cached[1]
 
         artifacts = self.debug_helper.capture_all(
             context=context,
@@ -248,6 +730,13 @@ class AutomationLogger:
         )
         
         self.logger.error(f"Debug artifacts captured for context '{context}': {artifacts}")
+
+        # Drop expired entries so the cache stays bounded by the TTL
+        self._capture_cache = {
+            key: entry for key, entry in self._capture_cache.items()
+            if now - entry[0] < self._CAPTURE_CACHE_TTL
+        }
+        self._capture_cache[cache_key] = (now, artifacts)
         return artifacts
 
     def capture_pyautogui_debug(
@@ -277,6 +766,7 @@ class AutomationLogger:
         Returns:
             Dictionary mapping PyAutoGUI-specific artifact types to file paths.
             Includes both visual and metadata artifacts for comprehensive debugging.
+            Empty when capture is disabled with AF_DEBUG_CAPTURE=0.
 
         Example:
             >>> try:
@@ -290,6 +780,8 @@ class AutomationLogger:
             ...         context="file_dialog_interaction"
             ...     )
         """
+        if not self._capture_enabled:
+            return {}
 
         artifacts = self.debug_helper.capture_pyautogui_debug(
             operation=operation,
@@ -302,7 +794,36 @@ class AutomationLogger:
         return artifacts
 
 
-automation_logger = AutomationLogger()
-'''
-Global instance of the class AutomationLogger
-'''
+_logger: Optional[AutomationLogger] = None
+_logger_lock = threading.Lock()
+
+
+def get_logger() -> AutomationLogger:
+    """
+    Return the global AutomationLogger instance, creating it on first use.
+
+    Handler setup is deferred until something actually logs, so importing
+    this module stays cheap and worker processes that reconfigure logging
+    never end up with the default handlers attached.
+
+    Returns:
+        The shared AutomationLogger instance.
+
+    Example:
+        >>> from automation_framework.utils.logger import get_logger
+        >>> get_logger().info("Starting login flow")
+    """
+    global _logger
+    # First use may come from several threads at once, e.g. screenshot workers
+    if _logger is None:
+        with _logger_lock:
+            if _logger is None:
+                _logger = AutomationLogger()
+    return _logger
+
+
+def __getattr__(name: str):
+    """Resolve the global ``automation_logger`` lazily (PEP 562)."""
+    if name == "automation_logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,15 +20,74 @@ Example:
     ...     print(f"Screenshot saved: {screenshot_path}")
 """
 
+import io
 import os
 import time
+import subprocess
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
 import mss
-from PIL import ImageGrab
-from datetime import datetime
+from PIL import Image, ImageGrab
 from typing import Optional, Union
 from pathlib import Path
 import platform
 
+# PNG encoding dominates capture time; favour speed over file size
+_PNG_SAVE_OPTIONS = {"compress_level": 1, "optimize": False}
+
+# Background workers that grab, encode and write system screenshots
+_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="shot")
+
+
+def _save_png(image: Image.Image, filepath: Path):
+    """
+    Encode image as PNG in memory and write it out with a single raw write.
+
+    Pillow writes straight to a file in many small chunks; encoding to a
+    buffer first turns that into one write of the finished file.
+    """
+    buf = io.BytesIO()
+    image.save(buf, "PNG", **_PNG_SAVE_OPTIONS)
+    data = buf.getbuffer()
+    fd = os.open(str(filepath), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        data.release()
+        os.close(fd)
+
+
+def _write_png_task(image: Image.Image, filepath: Path):
+    """
+    Background task that writes a grabbed screenshot to filepath.
+
+    Runs on a worker thread, where nobody else would see an error, so a
+    failure is logged and a diagnostic placeholder written before re-raising
+    for ScreenshotManager.flush() to report.
+    """
+    try:
+        _save_png(image, filepath)
+    except Exception as e:
+        from automation_framework.utils.logger import get_logger
+        get_logger().warning("Screenshot could not be written", extra={"path": str(filepath), "error": str(e)})
+        try:
+            filepath.write_text(f"Screenshot failed: {str(e)}")
+        except OSError:
+            pass
+        raise
+
+
+def _close_sct_sessions(sessions: list):
+    """Close mss sessions opened by a ScreenshotManager that is being collected."""
+    for sct in sessions:
+        try:
+            sct.close()
+        except Exception:
+            pass
+
 class ScreenshotManager:
     """
     Manages screenshot capture for debugging purposes across different platforms.
@@ -46,6 +105,12 @@ class ScreenshotManager:
     capabilities to prevent disk space issues from accumulating screenshots.
     """
 
+    # __weakref__ is needed for the finalizer that closes mss sessions
+    __slots__ = ("base_directory", "_tls", "_sct_sessions", "_pending", "_pending_lock", "__weakref__")
+
+    # Separators become underscores; characters invalid on some platforms are dropped
+    _TRANS = str.maketrans(" /\\", "___", '<>:"|?*')
+
     def __init__(self, base_directory: str = "logs/screenshots"):
         """
         Initialize the screenshot manager with organized storage structure.
@@ -62,6 +127,14 @@ class ScreenshotManager:
         """
         self.base_directory = Path(base_directory)
         self.base_directory.mkdir(parents=True, exist_ok=True)
+        # mss sessions hold display handles and probe the monitor layout when
+        # opened, so each thread keeps one open for reuse across captures
+        self._tls = threading.local()
+        self._sct_sessions = []
+        weakref.finalize(self, _close_sct_sessions, self._sct_sessions)
+        # Background PNG writes; captures can run concurrently from several threads
+        self._pending = []
+        self._pending_lock = threading.Lock()
 
     def capture_on_failure(
         self,
@@ -84,6 +157,11 @@ class ScreenshotManager:
         making it robust for production environments where debugging
         information is critical.
 
+        The screen is grabbed right away on the calling thread, so the image
+        shows the state at the time of failure. Where the image is grabbed
+        in-process (mss, Pillow), PNG encoding and writing then run on a
+        background worker; call flush() to wait for them, e.g. in test teardown.
+
         Args:
             context: Context or page where failure occurred (e.g., 'login_page').
                     Used in filename generation to identify the test scenario.
@@ -93,7 +171,8 @@ class ScreenshotManager:
             suffix: Optional suffix to add to filename for supplementary info.
 
         Returns:
-            Absolute path to the saved screenshot file as a string.
+            Absolute path the screenshot is being written to, as a string.
+            The file may not be complete until its background write finishes.
             The path can be used for logging, reporting, or automated analysis.
 
         Example:
@@ -105,7 +184,7 @@ class ScreenshotManager:
             >>> print(path)
             'logs/screenshots/payment_form_validation_error_20231201_143022.png'
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         
         # Sanitize context and error_type for filename compatibility
         sanitized_context = self._sanitize_filename(context)
@@ -121,18 +200,60 @@ class ScreenshotManager:
         
         filename = "_".join(filename_parts) + ".png"
         filepath = self.base_directory / filename
-        
+
         # Take screenshot using platform-appropriate method
-        if platform.system() == "Windows":
-            self._capture_windows_screenshot(filepath)
-        elif platform.system() in ["Darwin", "Linux"]:
-            self._capture_unix_screenshot(filepath)
-        else:
-            # Fallback: try PIL/Pillow if available
-            self._capture_fallback_screenshot(filepath)
-        
+        try:
+            system = platform.system()
+            if system == "Windows":
+                self._capture_windows_screenshot(filepath)
+            elif system in ["Darwin", "Linux"]:
+                self._capture_unix_screenshot(filepath)
+            else:
+                # Fallback: try PIL/Pillow if available
+                self._capture_fallback_screenshot(filepath)
+        except Exception as e:
+            from automation_framework.utils.logger import get_logger
+            get_logger().warning("Screenshot capture failed", extra={"path": str(filepath), "error": str(e)})
+            filepath.write_text(f"Screenshot failed: {str(e)}")
+
         return str(filepath)
 
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Wait for screenshots that are still being written in the background.
+
+        Writes that have not finished within the timeout stay pending for
+        the next flush.
+
+        Args:
+            timeout: Maximum number of seconds to wait; waits indefinitely
+                    when not given.
+
+        Raises:
+            Exception: The error of a write that failed, or a RuntimeError
+                      chained to the first error when several failed. Failed
+                      writes have already been logged and a placeholder file
+                      written in their place.
+
+        Example:
+            >>> manager = ScreenshotManager()
+            >>> manager.capture_on_failure(context="login_page")
+            >>> manager.flush()  # screenshot file is now on disk
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        done, not_done = wait(pending, timeout=timeout)
+        with self._pending_lock:
+            self._pending.extend(not_done)
+
+        errors = [future.exception() for future in done if future.exception() is not None]
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise RuntimeError(
+                f"{len(errors)} screenshots could not be written; first error: {errors[0]}"
+            ) from errors[0]
+
     def capture_with_driver(
         self,
         driver: object,
@@ -174,7 +295,7 @@ class ScreenshotManager:
             ...     action="payment_failed"
             ... )
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"{context}_{action}_{timestamp}.png"
         filepath = self.base_directory / filename
         
@@ -188,6 +309,23 @@ class ScreenshotManager:
         
         return str(filepath)
 
+    def _write_png(self, image: Image.Image, filepath: Path):
+        """
+        Hand a grabbed image to a background worker for encoding and writing.
+
+        Args:
+            image: Screenshot grabbed on the calling thread.
+            filepath: Destination path where the screenshot should be saved.
+        """
+        future = _EXEC.submit(_write_png_task, image, filepath)
+        with self._pending_lock:
+            # Keep failed writes around so flush() can report them
+            self._pending = [
+                pending for pending in self._pending
+                if not pending.done() or pending.exception() is not None
+            ]
+            self._pending.append(future)
+
     def _sanitize_filename(self, name: str) -> str:
         """
         Transform potentially unsafe strings into filename-compatible format.
@@ -202,36 +340,50 @@ class ScreenshotManager:
         Returns:
             Clean, filename-safe string with problematic characters removed or replaced.
         """
-        # Replace problematic characters with underscores
-        sanitized = name.replace(" ", "_").replace("/", "_").replace("\\", "_")
-        # Remove other potentially problematic characters that cause issues on various platforms
-        for char in '<>:"/\\|?*':
-            sanitized = sanitized.replace(char, "")
-        return sanitized
+        return name.translate(self._TRANS)
 
     def _capture_windows_screenshot(self, filepath: Path):
         """
         Capture high-quality screenshot on Windows systems using optimized methods.
 
         This method prioritizes the mss library for fast, efficient screenshot
-        capture on Windows, falling back to PIL/Pillow when mss is unavailable.
+        capture on Windows, falling back to PIL/Pillow when mss cannot grab the screen.
         The implementation focuses on reliability and performance for
-        automated testing scenarios.
+        automated testing scenarios. The primary monitor is grabbed as raw
+        pixels and handed to Pillow without conversion, then encoded at a low
+        zlib level, which is much cheaper than mss's own PNG writer.
 
         Args:
             filepath: Destination path where the screenshot should be saved.
                      Should have .png extension for optimal compatibility.
         """
         try:
-            with mss.mss() as sct:
-                sct.shot(output=str(filepath))
-        except ImportError:
-            # Fallback to PIL if mss not available
-            self._capture_fallback_screenshot(filepath)
-        except Exception:
-            # Fallback on any error to ensure screenshot availability
+            sct = self._get_sct()
+            raw = sct.grab(sct.monitors[1])
+            # Wrap mss's BGRA buffer directly; raw.rgb would build a converted copy
+            self._write_png(Image.frombuffer("RGB", raw.size, raw.raw, "raw", "BGRX", 0, 1), filepath)
+        except mss.ScreenShotError as e:
+            from automation_framework.utils.logger import get_logger
+            get_logger().warning("mss screenshot failed, using PIL fallback", extra={"error": str(e)})
             self._capture_fallback_screenshot(filepath)
 
+    def _get_sct(self):
+        """
+        Return the mss session of the calling thread, opening it on first use.
+
+        mss sessions are bound to the thread that created them, so sessions
+        are kept per thread rather than shared by the manager.
+
+        Returns:
+            Open mss screenshot session for the current thread.
+        """
+        sct = getattr(self._tls, "sct", None)
+        if sct is None:
+            sct = mss.mss()
+            self._tls.sct = sct
+            self._sct_sessions.append(sct)
+        return sct
+
     def _capture_unix_screenshot(self, filepath: Path):
         """
         Capture screenshot on Unix-like systems using native tools.
@@ -246,9 +398,6 @@ class ScreenshotManager:
             filepath: Path where the screenshot should be stored.
                      Should have .png extension for standardization.
         """
-        import subprocess
-        import platform
-        
         system = platform.system()
         try:
             if system == "Darwin":  # macOS
@@ -276,14 +425,12 @@ class ScreenshotManager:
                      If screenshot fails, creates a diagnostic text file instead.
         """
         try:
-            screenshot = ImageGrab.grab()
-            screenshot.save(filepath)
-        except ImportError:
-            # No screenshot capability available - create diagnostic file
-            filepath.write_text(f"Screenshot unavailable on {platform.system()}")
+            image = ImageGrab.grab()
         except Exception as e:
             # Log the error but continue with diagnostic file
             filepath.write_text(f"Screenshot failed: {str(e)}")
+            return
+        self._write_png(image, filepath)
 
     def cleanup_old_screenshots(self, days_to_keep: int = 7):
         """
@@ -306,9 +453,11 @@ class ScreenshotManager:
             >>> manager = ScreenshotManager()
             >>> manager.cleanup_old_screenshots(days_to_keep=3)
         """
-        import time
         cutoff_time = time.time() - (days_to_keep * 24 * 60 * 60)
-        
-        for screenshot_file in self.base_directory.glob("*.png"):
-            if screenshot_file.stat().st_mtime < cutoff_time:
-                screenshot_file.unlink()
\ No newline at end of file
+
+        # One directory pass; DirEntry caches the type so only mtime needs a stat
+        with os.scandir(self.base_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".png") and entry.is_file(follow_symlinks=False):
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
\ No newline at end of file